@@ -1,4 +1,4 @@
-from dbt.utils import filter_null_values, deep_merge, classproperty
+from dbt.utils import filter_null_values, deep_merge_into, classproperty
 from dbt.node_types import NodeType
 
 import dbt.exceptions
@@ -61,7 +61,7 @@ class FakeAPIObject(JsonSchemaMixin, Replaceable, Mapping):
 
     def incorporate(self, **kwargs):
         value = self.to_dict()
-        value = deep_merge(value, kwargs)
+        value = deep_merge_into(value, kwargs)
         return self.from_dict(value)
 
 
@@ -291,7 +291,7 @@ class BaseRelation(FakeAPIObject, Hashable):
     ) -> Self:
         source_quoting = source.quoting.to_dict()
         source_quoting.pop('column', None)
-        quote_policy = deep_merge(
+        quote_policy = deep_merge_into(
             cls.get_default_quote_policy().to_dict(),
             source_quoting,
             kwargs.get('quote_policy', {}),
@@ -1,7 +1,6 @@
-from functools import wraps
+from functools import wraps, lru_cache
 import requests
 from dbt.exceptions import RegistryException
-from dbt.utils import memoized
 from dbt.logger import GLOBAL_LOGGER as logger
 import os
 import time
@@ -54,7 +53,7 @@ def index(registry_base_url=None):
     return _get('api/v1/index.json', registry_base_url)
 
 
-index_cached = memoized(index)
+index_cached = lru_cache(maxsize=None)(index)
 
 
 def packages(registry_base_url=None):
@@ -11,7 +11,7 @@ from dbt.parser.base import Parser
 from dbt.parser.search import (
     FullBlock, FileBlock, FilesystemSearcher, BlockSearcher
 )
-from dbt.utils import deep_merge, DOCS_PREFIX
+from dbt.utils import deep_merge_into, DOCS_PREFIX
 
 
 class DocumentationParser(Parser[ParsedDocumentation]):
@@ -49,7 +49,7 @@ class DocumentationParser(Parser[ParsedDocumentation]):
 
             unique_id = self.generate_unique_id(name)
 
-            merged = deep_merge(
+            merged = deep_merge_into(
                 docfile.to_dict(),
                 {
                     'name': name,
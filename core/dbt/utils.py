@@ -1,4 +1,3 @@
-import collections
 import concurrent.futures
 import copy
 import datetime
@@ -11,7 +10,8 @@ import os
 from enum import Enum
 from typing_extensions import Protocol
 from typing import (
-    Tuple, Type, Any, Optional, TypeVar, Dict, Union, Callable
+    Tuple, Type, Any, Optional, TypeVar, Dict, Union, Callable, List, Set,
+    FrozenSet
 )
 
 import dbt.exceptions
@@ -28,6 +28,13 @@ except ImportError:
 else:
     DECIMALS = (decimal.Decimal, cdecimal.Decimal)
 
+_SEP = os.sep
+
+_ATOMIC_TYPES: Tuple[Type[Any], ...] = (int, float, str, type(None), bool)
+_ATOMIC_TYPE_SET: FrozenSet[Type[Any]] = frozenset(_ATOMIC_TYPES)
+_CONTAINER_TYPES: Tuple[Type[Any], ...] = (list, dict)
+_OK_TYPES: Tuple[Type[Any], ...] = _CONTAINER_TYPES + _ATOMIC_TYPES
+
 
 class ExitCodes(int, Enum):
     Success = 0
@@ -78,8 +85,8 @@ def get_model_name_or_none(model):
 def compiler_warning(model, msg, resource_type='model'):
     name = get_model_name_or_none(model)
     logger.info(
-        "* Compilation warning while compiling {} {}:\n* {}\n"
-        .format(resource_type, name, msg)
+        f"* Compilation warning while compiling {resource_type} {name}:\n"
+        f"* {msg}\n"
     )
 
 
@@ -90,21 +97,22 @@ DOCS_PREFIX = 'dbt_docs__'
 def get_dbt_macro_name(name):
     if name is None:
         raise dbt.exceptions.InternalException('Got None for a macro name!')
-    return '{}{}'.format(MACRO_PREFIX, name)
+    return f'{MACRO_PREFIX}{name}'
 
 
 def get_dbt_docs_name(name):
     if name is None:
         raise dbt.exceptions.InternalException('Got None for a doc name!')
-    return '{}{}'.format(DOCS_PREFIX, name)
+    return f'{DOCS_PREFIX}{name}'
 
 
+@functools.lru_cache(maxsize=256)
 def get_materialization_macro_name(materialization_name, adapter_type=None,
                                    with_prefix=True):
     if adapter_type is None:
         adapter_type = 'default'
 
-    name = 'materialization_{}_{}'.format(materialization_name, adapter_type)
+    name = f'materialization_{materialization_name}_{adapter_type}'
 
     if with_prefix:
         return get_dbt_macro_name(name)
@@ -120,29 +128,19 @@ def get_docs_macro_name(docs_name, with_prefix=True):
 
 
 def split_path(path):
-    return path.split(os.sep)
+    return path.split(_SEP)
 
 
 def merge(*args):
     if len(args) == 0:
         return None
 
-    if len(args) == 1:
-        return args[0]
-
-    lst = list(args)
-    last = lst.pop(len(lst) - 1)
-
-    return _merge(merge(*lst), last)
-
-
-def _merge(a, b):
-    to_return = a.copy()
-    to_return.update(b)
-    return to_return
+    result = {**args[0]}
+    for arg in args[1:]:
+        result.update(arg)
+    return result
 
 
-# http://stackoverflow.com/questions/20656135/python-deep-merge-dictionary-data
 def deep_merge(*args):
     """
     >>> dbt.utils.deep_merge({'a': 1, 'b': 2, 'c': 3}, {'a': 2}, {'a': 3, 'b': 1})  # noqa
@@ -151,33 +149,42 @@ def deep_merge(*args):
     if len(args) == 0:
         return None
 
-    if len(args) == 1:
-        return copy.deepcopy(args[0])
-
-    lst = list(args)
-    last = copy.deepcopy(lst.pop(len(lst) - 1))
-
-    return _deep_merge(deep_merge(*lst), last)
+    result: Dict[Any, Any] = {}
+    for arg in args:
+        _iter_merge(result, copy.deepcopy(arg))
+    return result
 
 
-def _deep_merge(destination, source):
-    if isinstance(source, dict):
-        for key, value in source.items():
-            deep_merge_item(destination, key, value)
-        return destination
+def deep_merge_into(destination, *sources):
+    """Merge sources into destination the same way deep_merge does, but
+    in place and without copying anything. Only use this when none of the
+    arguments are used again afterwards: destination's nested values are
+    modified, and nested values from the sources may end up in destination.
+    """
+    for source in sources:
+        _iter_merge(destination, source)
+    return destination
 
 
-def deep_merge_item(destination, key, value):
-    if isinstance(value, dict):
-        node = destination.setdefault(key, {})
-        destination[key] = deep_merge(node, value)
-    elif isinstance(value, tuple) or isinstance(value, list):
-        if key in destination:
-            destination[key] = list(value) + list(destination[key])
-        else:
-            destination[key] = value
-    else:
-        destination[key] = value
+def _iter_merge(destination, source):
+    """Merge source into destination in place, without recursion. Nested
+    dicts are merged key by key, lists/tuples present on both sides are
+    concatenated (source first), and anything else in source wins.
+    """
+    stack = [(destination, source)]
+    while stack:
+        dest, src = stack.pop()
+        for key, value in src.items():
+            if key in dest:
+                existing = dest[key]
+                if isinstance(value, dict) and isinstance(existing, dict):
+                    stack.append((existing, value))
+                    continue
+                if (isinstance(value, (list, tuple)) and
+                        isinstance(existing, (list, tuple))):
+                    dest[key] = [*value, *existing]
+                    continue
+            dest[key] = value
 
 
 def _deep_map(
@@ -185,31 +192,67 @@ def _deep_map(
     value: Any,
     keypath: Tuple[Union[str, int], ...],
 ) -> Any:
-    atomic_types: Tuple[Type[Any], ...] = (int, float, str, type(None), bool)
-
-    ret: Any
-
-    if isinstance(value, list):
-        ret = [
-            _deep_map(func, v, (keypath + (idx,)))
-            for idx, v in enumerate(value)
-        ]
-    elif isinstance(value, dict):
-        ret = {
-            k: _deep_map(func, v, (keypath + (str(k),)))
-            for k, v in value.items()
-        }
-    elif isinstance(value, atomic_types):
-        ret = func(value, keypath)
-    else:
-        container_types: Tuple[Type[Any], ...] = (list, dict)
-        ok_types = container_types + atomic_types
-        raise dbt.exceptions.DbtConfigError(
-            'in _deep_map, expected one of {!r}, got {!r}'
-            .format(ok_types, type(value))
-        )
+    # Walk the value with an explicit stack instead of recursing. Each entry
+    # is (parent, key, node, keypath): the mapped node gets stored in
+    # parent[key]. Containers are created before their children are visited,
+    # so dicts keep their key order and func is called in document order. A
+    # parent of None marks the end of a container, and is used to maintain
+    # the set of containers currently being visited for cycle detection.
+    root: List[Any] = [None]
+    visiting: Set[int] = set()
+    stack: List[Tuple[Any, Any, Any, Tuple[Union[str, int], ...]]] = [
+        (root, 0, value, keypath)
+    ]
+
+    while stack:
+        parent, key, node, path = stack.pop()
+        if parent is None:
+            visiting.discard(node)
+            continue
+
+        ret: Any
+        children: List[Tuple[Any, Any, Any, Tuple[Union[str, int], ...]]]
+        if isinstance(node, list):
+            if all(type(v) in _ATOMIC_TYPE_SET for v in node):
+                # no nested containers, so no need to push anything
+                parent[key] = [
+                    func(v, path + (idx,)) for idx, v in enumerate(node)
+                ]
+                continue
+            ret = [None] * len(node)
+            children = [
+                (ret, idx, v, path + (idx,)) for idx, v in enumerate(node)
+            ]
+        elif isinstance(node, dict):
+            if all(type(v) in _ATOMIC_TYPE_SET for v in node.values()):
+                parent[key] = {
+                    k: func(v, path + (str(k),)) for k, v in node.items()
+                }
+                continue
+            ret = {}
+            children = [
+                (ret, k, v, path + (str(k),)) for k, v in node.items()
+            ]
+        elif isinstance(node, _ATOMIC_TYPES):
+            parent[key] = func(node, path)
+            continue
+        else:
+            raise dbt.exceptions.DbtConfigError(
+                'in _deep_map, expected one of {!r}, got {!r}'
+                .format(_OK_TYPES, type(node))
+            )
+
+        node_id = id(node)
+        if node_id in visiting:
+            raise dbt.exceptions.RecursionException(
+                'Cycle detected in deep_map'
+            )
+        visiting.add(node_id)
+        parent[key] = ret
+        stack.append((None, None, node_id, path))
+        stack.extend(reversed(children))
 
-    return ret
+    return root[0]
 
 
 def deep_map(
@@ -231,20 +274,26 @@ def deep_map(
     :raises: If there are cycles in the value, raises a
         dbt.exceptions.RecursionException
     """
-    try:
-        return _deep_map(func, value, ())
-    except RuntimeError as exc:
-        if 'maximum recursion depth exceeded' in str(exc):
-            raise dbt.exceptions.RecursionException(
-                'Cycle detected in deep_map'
-            )
-        raise
+    return _deep_map(func, value, ())
 
 
 class AttrDict(dict):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.__dict__ = self
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def __delattr__(self, name):
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name) from None
 
 
 def is_enabled(node):
@@ -255,13 +304,13 @@ def get_pseudo_test_path(node_name, source_path, test_type):
     "schema tests all come from schema.yml files. fake a source sql file"
     source_path_parts = split_path(source_path)
     source_path_parts.pop()  # ignore filename
-    suffix = [test_type, "{}.sql".format(node_name)]
+    suffix = [test_type, f"{node_name}.sql"]
     pseudo_path_parts = source_path_parts + suffix
     return os.path.join(*pseudo_path_parts)
 
 
 def get_pseudo_hook_path(hook_name):
-    path_parts = ['hooks', "{}.sql".format(hook_name)]
+    path_parts = ['hooks', f"{hook_name}.sql"]
     return os.path.join(*path_parts)
 
 
@@ -269,46 +318,23 @@ def md5(string):
     return hashlib.md5(string.encode('utf-8')).hexdigest()
 
 
+# these hashes are sent with anonymous usage tracking events and compared
+# across runs and dbt versions, so they have to stay md5.
 def get_hash(model):
-    return hashlib.md5(model.unique_id.encode('utf-8')).hexdigest()
+    return md5(model.unique_id)
 
 
 def get_hashed_contents(model):
-    return hashlib.md5(model.raw_sql.encode('utf-8')).hexdigest()
+    return md5(model.raw_sql)
 
 
 def flatten_nodes(dep_list):
     return list(itertools.chain.from_iterable(dep_list))
 
 
-class memoized:
-    '''Decorator. Caches a function's return value each time it is called. If
-    called later with the same arguments, the cached value is returned (not
-    reevaluated).
-
-    Taken from https://wiki.python.org/moin/PythonDecoratorLibrary#Memoize'''
-    def __init__(self, func):
-        self.func = func
-        self.cache = {}
-
-    def __call__(self, *args):
-        if not isinstance(args, collections.Hashable):
-            # uncacheable. a list, for instance.
-            # better to not cache than blow up.
-            return self.func(*args)
-        if args in self.cache:
-            return self.cache[args]
-        value = self.func(*args)
-        self.cache[args] = value
-        return value
-
-    def __repr__(self):
-        '''Return the function's docstring.'''
-        return self.func.__doc__
-
-    def __get__(self, obj, objtype):
-        '''Support instance methods.'''
-        return functools.partial(self.__call__, obj)
+# dbt no longer uses this, but adapters and other third-party code may still
+# import it from here.
+memoized = functools.lru_cache(maxsize=None)
 
 
 def invalid_ref_test_message(node, target_model_name, target_model_package,
@@ -378,7 +404,7 @@ def filter_null_values(input: Dict[K_T, Optional[V_T]]) -> Dict[K_T, V_T]:
 
 
 def add_ephemeral_model_prefix(s: str) -> str:
-    return '__dbt__CTE__{}'.format(s)
+    return f'__dbt__CTE__{s}'
 
 
 def timestring() -> str:
@@ -392,15 +418,28 @@ class JSONEncoder(json.JSONEncoder):
     handles `Decimal`s. Naturally, this can lose precision because they get
     converted to floats.
     """
+    # exact-type lookups for the common cases, so most values skip the
+    # isinstance/getattr checks below
+    _DISPATCH: Dict[Type[Any], Callable[[Any], Any]] = {
+        datetime.datetime: datetime.datetime.isoformat,
+        datetime.date: datetime.date.isoformat,
+        datetime.time: datetime.time.isoformat,
+    }
+    _DISPATCH.update((d, float) for d in DECIMALS)
+
     def default(self, obj):
+        fn = self._DISPATCH.get(type(obj))
+        if fn is not None:
+            return fn(obj)
         if isinstance(obj, DECIMALS):
             return float(obj)
         if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
             return obj.isoformat()
-        if hasattr(obj, 'to_dict'):
+        to_dict = getattr(obj, 'to_dict', None)
+        if to_dict is not None:
             # if we have a to_dict we should try to serialize the result of
             # that!
-            obj = obj.to_dict()
+            return to_dict()
         return super().default(obj)
 
 
@@ -424,6 +463,10 @@ def translate_aliases(
         canonical key.
     :raises: `AliasException`, if a canonical key is defined more than once.
     """
+    if not aliases.keys() & kwargs.keys():
+        # nothing to translate, so every key is already canonical and unique
+        return dict(kwargs)
+
     result: Dict[str, Any] = {}
 
     for given_key, value in kwargs.items():
@@ -443,13 +486,18 @@ def translate_aliases(
     return result
 
 
+_NODE_TYPE_PLURALS: Dict[str, str] = {
+    node_type.value: node_type.pluralize() for node_type in NodeType
+}
+
+
 def _pluralize(string: Union[str, NodeType]) -> str:
-    try:
-        convert = NodeType(string)
-    except ValueError:
+    if isinstance(string, NodeType):
+        string = string.value
+    plural = _NODE_TYPE_PLURALS.get(string)
+    if plural is None:
         return f'{string}s'
-    else:
-        return convert.pluralize()
+    return plural
 
 
 def pluralize(count, string: Union[str, NodeType]):
@@ -469,10 +517,13 @@ def coerce_dict_str(value: Any) -> Optional[Dict[str, Any]]:
     easier. You get either `None` if it's not a Dict[str, Any], or the
     Dict[str, Any] you expected (to pass it to JsonSchemaMixin.from_dict(...)).
     """
-    if (isinstance(value, dict) and all(isinstance(k, str) for k in value)):
-        return value
-    else:
+    if not isinstance(value, dict):
         return None
+    for key in value:
+        # the exact type check is a cheap fast path for the usual case
+        if type(key) is not str and not isinstance(key, str):
+            return None
+    return value
 
 
 # some types need to make constants available to the jinja context as
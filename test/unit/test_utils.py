@@ -1,7 +1,13 @@
+import copy
+import datetime
+import decimal
+import json
+import os
 import unittest
 
 import dbt.exceptions
 import dbt.utils
+from dbt.node_types import NodeType
 
 
 class TestDeepMerge(unittest.TestCase):
@@ -23,6 +29,52 @@ class TestDeepMerge(unittest.TestCase):
                 'failed on {} (actual {}, expected {})'.format(
                     case['description'], actual, case['expected']))
 
+    def test__nested_cases(self):
+        cases = [
+            {'args': [{'a': {'b': 1, 'c': 2}}, {'a': {'b': 3}}],
+             'expected': {'a': {'b': 3, 'c': 2}},
+             'description': 'nested dicts'},
+            {'args': [{'a': {'b': {'c': 1}}}, {'a': {'b': {'d': 2}}}],
+             'expected': {'a': {'b': {'c': 1, 'd': 2}}},
+             'description': 'deeply nested dicts'},
+            {'args': [{'a': [1, 2]}, {'a': (3,)}],
+             'expected': {'a': [3, 1, 2]},
+             'description': 'lists are concatenated'},
+            {'args': [{'a': 'x'}, {'a': {'b': 1}}],
+             'expected': {'a': {'b': 1}},
+             'description': 'dict replaces scalar'},
+            {'args': [{'a': 'abc'}, {'a': ['x']}],
+             'expected': {'a': ['x']},
+             'description': 'list replaces string'},
+        ]
+
+        for case in cases:
+            actual = dbt.utils.deep_merge(*case['args'])
+            self.assertEqual(
+                case['expected'], actual,
+                'failed on {} (actual {}, expected {})'.format(
+                    case['description'], actual, case['expected']))
+
+    def test__does_not_mutate(self):
+        first = {'a': {'b': [1]}}
+        second = {'a': {'b': [2], 'c': {'d': 1}}}
+        result = dbt.utils.deep_merge(first, second)
+        self.assertEqual(result, {'a': {'b': [2, 1], 'c': {'d': 1}}})
+        self.assertEqual(first, {'a': {'b': [1]}})
+        self.assertEqual(second, {'a': {'b': [2], 'c': {'d': 1}}})
+        result['a']['c']['d'] = 2
+        self.assertEqual(second['a']['c']['d'], 1)
+
+    def test__deep_merge_into(self):
+        destination = {'a': {'b': 1}, 'c': [1]}
+        result = dbt.utils.deep_merge_into(
+            destination, {'a': {'d': 2}, 'c': [2]}, {'e': 3}
+        )
+        self.assertIs(result, destination)
+        self.assertEqual(
+            destination, {'a': {'b': 1, 'd': 2}, 'c': [2, 1], 'e': 3}
+        )
+
 
 class TestMerge(unittest.TestCase):
 
@@ -43,6 +95,16 @@ class TestMerge(unittest.TestCase):
                 'failed on {} (actual {}, expected {})'.format(
                     case['description'], actual, case['expected']))
 
+    def test__merge(self):
+        self.assertIsNone(dbt.utils.merge())
+        first = {'a': 1, 'b': 1}
+        self.assertEqual(dbt.utils.merge(first), first)
+        self.assertEqual(
+            dbt.utils.merge(first, {'b': 2}, {'c': 3}),
+            {'a': 1, 'b': 2, 'c': 3}
+        )
+        self.assertEqual(first, {'a': 1, 'b': 1})
+
 
 class TestDeepMap(unittest.TestCase):
     def setUp(self):
@@ -139,6 +201,91 @@ class TestDeepMap(unittest.TestCase):
         with self.assertRaises(dbt.exceptions.DbtConfigError):
             dbt.utils.deep_map(lambda x, _: x, {'foo': object()})
 
+    def test__cycles(self):
+        value = {'foo': [1, 2]}
+        value['foo'].append(value)
+        with self.assertRaises(dbt.exceptions.RecursionException):
+            dbt.utils.deep_map(lambda x, _: x, value)
+
+    def test__shared_values(self):
+        shared = {'a': 1}
+        value = {'foo': shared, 'bar': [shared, shared]}
+        keypaths = []
+
+        def record(v, keypath):
+            keypaths.append(keypath)
+            return v
+
+        actual = dbt.utils.deep_map(record, value)
+        self.assertEqual(actual, value)
+        self.assertEqual(
+            keypaths,
+            [('foo', 'a'), ('bar', 0, 'a'), ('bar', 1, 'a')]
+        )
+
+    def test__deeply_nested(self):
+        value = 'leaf'
+        for _ in range(5000):
+            value = [value]
+        actual = dbt.utils.deep_map(lambda x, _: x, value)
+        for _ in range(5000):
+            actual = actual[0]
+        self.assertEqual(actual, 'leaf')
+
+
+class TestAttrDict(unittest.TestCase):
+
+    def test__simple_cases(self):
+        value = dbt.utils.AttrDict({'a': 1})
+        self.assertEqual(value.a, 1)
+        value.b = 2
+        self.assertEqual(value, {'a': 1, 'b': 2})
+        del value.a
+        self.assertEqual(value, {'b': 2})
+        with self.assertRaises(AttributeError):
+            value.a
+        with self.assertRaises(AttributeError):
+            del value.a
+        self.assertEqual(getattr(value, 'a', None), None)
+
+    def test__copy(self):
+        value = dbt.utils.AttrDict({'a': [1]})
+        copied = copy.deepcopy(value)
+        self.assertIsInstance(copied, dbt.utils.AttrDict)
+        self.assertEqual(copied.a, [1])
+        self.assertIsNot(copied.a, value.a)
+
+
+class TestPaths(unittest.TestCase):
+
+    def test__pseudo_test_path(self):
+        self.assertEqual(
+            dbt.utils.get_pseudo_test_path(
+                'my_test', os.path.join('models', 'sub', 'schema.yml'),
+                'schema_test'
+            ),
+            os.path.join('models', 'sub', 'schema_test', 'my_test.sql')
+        )
+        self.assertEqual(
+            dbt.utils.get_pseudo_test_path('my_test', 'schema.yml', 'data'),
+            os.path.join('data', 'my_test.sql')
+        )
+
+
+class TestMemoized(unittest.TestCase):
+
+    def test__simple_cases(self):
+        calls = []
+
+        @dbt.utils.memoized
+        def double(value):
+            calls.append(value)
+            return value * 2
+
+        self.assertEqual(double(2), 4)
+        self.assertEqual(double(2), 4)
+        self.assertEqual(double(3), 6)
+        self.assertEqual(calls, [2, 3])
 
 
 class TestBytesFormatting(unittest.TestCase):
@@ -152,3 +299,91 @@ class TestBytesFormatting(unittest.TestCase):
         self.assertEqual(dbt.utils.format_bytes(1024**3*52.6), '52.6 GB')
         self.assertEqual(dbt.utils.format_bytes(1024**4*128), '128.0 TB')
         self.assertEqual(dbt.utils.format_bytes(1024**5+1), '> 1024 TB')
+
+
+class TestTranslateAliases(unittest.TestCase):
+
+    def test__simple_cases(self):
+        aliases = {'username': 'user', 'pass': 'password'}
+        self.assertEqual(dbt.utils.translate_aliases({}, aliases), {})
+        self.assertEqual(
+            dbt.utils.translate_aliases({'user': 'a', 'port': 1}, aliases),
+            {'user': 'a', 'port': 1}
+        )
+        self.assertEqual(
+            dbt.utils.translate_aliases(
+                {'username': 'a', 'pass': 'b', 'port': 1}, aliases
+            ),
+            {'user': 'a', 'password': 'b', 'port': 1}
+        )
+
+    def test__duplicates(self):
+        aliases = {'username': 'user'}
+        with self.assertRaises(dbt.exceptions.AliasException):
+            dbt.utils.translate_aliases(
+                {'user': 'a', 'username': 'b'}, aliases
+            )
+
+
+class TestCoerceDictStr(unittest.TestCase):
+
+    def test__simple_cases(self):
+        self.assertEqual(dbt.utils.coerce_dict_str({}), {})
+        self.assertEqual(dbt.utils.coerce_dict_str({'a': 1}), {'a': 1})
+        self.assertEqual(
+            dbt.utils.coerce_dict_str({NodeType.Model: 1}),
+            {NodeType.Model: 1}
+        )
+        self.assertIsNone(dbt.utils.coerce_dict_str({'a': 1, 2: 'b'}))
+        self.assertIsNone(dbt.utils.coerce_dict_str(['a']))
+        self.assertIsNone(dbt.utils.coerce_dict_str(None))
+
+
+class TestPluralize(unittest.TestCase):
+
+    def test__simple_cases(self):
+        self.assertEqual(dbt.utils.pluralize(1, 'model'), '1 model')
+        self.assertEqual(dbt.utils.pluralize(2, 'model'), '2 models')
+        self.assertEqual(dbt.utils.pluralize(2, 'analysis'), '2 analyses')
+        self.assertEqual(
+            dbt.utils.pluralize(2, NodeType.Analysis), '2 analyses'
+        )
+        self.assertEqual(dbt.utils.pluralize(0, NodeType.Seed), '0 seeds')
+        self.assertEqual(dbt.utils.pluralize(3, 'error'), '3 errors')
+
+
+class TestJSONEncoder(unittest.TestCase):
+
+    def test__simple_cases(self):
+        class HasToDict:
+            def to_dict(self):
+                return {'a': 1}
+
+        value = {
+            'decimal': decimal.Decimal('1.5'),
+            'datetime': datetime.datetime(2020, 1, 2, 3, 4, 5),
+            'date': datetime.date(2020, 1, 2),
+            'time': datetime.time(3, 4, 5),
+            'obj': HasToDict(),
+        }
+        encoded = json.dumps(value, cls=dbt.utils.JSONEncoder)
+        self.assertEqual(json.loads(encoded), {
+            'decimal': 1.5,
+            'datetime': '2020-01-02T03:04:05',
+            'date': '2020-01-02',
+            'time': '03:04:05',
+            'obj': {'a': 1},
+        })
+
+    def test__subclasses(self):
+        class MyDecimal(decimal.Decimal):
+            pass
+
+        encoded = json.dumps(MyDecimal('2.5'), cls=dbt.utils.JSONEncoder)
+        self.assertEqual(encoded, '2.5')
+
+    def test__unserializable(self):
+        with self.assertRaises(TypeError):
+            json.dumps(object(), cls=dbt.utils.JSONEncoder)
+        encoded = json.dumps(1j, cls=dbt.utils.ForgivingJSONEncoder)
+        self.assertEqual(encoded, '"1j"')